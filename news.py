@@ -6,6 +6,7 @@ relevance heuristic (term frequency + recency), and write top N articles to
 
 Requirements:
   pip install requests python-dotenv
+  pip install orjson  # optional, faster response parsing
 
 Usage:
   - Set SERPAPI_KEY in environment or in a local `.env` file:
@@ -13,14 +14,25 @@ Usage:
   - Run: python news.py
 """
 
+import functools
+import hashlib
+import heapq
+import json
 import os
+import sqlite3
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 import math
+from operator import itemgetter
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("Missing dependency: requests. Install with: pip install requests")
     sys.exit(1)
@@ -32,20 +44,111 @@ except Exception:
     # dotenv is optional
     pass
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; responses are parsed with resp.json()
+    orjson = None
+
 SERPAPI_KEY = os.getenv("SERPAPI_KEY")
 
 API_URL = "https://serpapi.com/search.json"
 
+_SESSION = None
+
+# On-disk cache of raw SerpApi results, keyed by (company, page, page_size).
+CACHE_PATH = os.getenv("SERPAPI_CACHE_PATH", "serpapi_cache.db")
+CACHE_TTL = 900  # seconds; news goes stale quickly
+_cache_conn = None
+_cache_lock = threading.Lock()
+
+
+def _cache_key(company, page, page_size):
+    return hashlib.sha1(f"{company}|{page}|{page_size}".encode("utf-8")).hexdigest()
+
+
+def new_session():
+    """Create a requests.Session that pools keep-alive connections and
+    retries transient 429/5xx responses with backoff."""
+    session = requests.Session()
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=8,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+        ),
+    )
+    return session
+
+
+def _get_session():
+    """Module-wide session, created on first use."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = new_session()
+    return _SESSION
+
+
+def open_cache(path=None):
+    """Open the SQLite response cache at `path` (default CACHE_PATH). The
+    connection may be shared between threads."""
+    conn = sqlite3.connect(path or CACHE_PATH, check_same_thread=False)
+    conn.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, ts REAL, json BLOB)")
+    conn.commit()
+    return conn
+
+
+def _get_cache():
+    """Module-wide cache connection, opened on first use (call with _cache_lock held)."""
+    global _cache_conn
+    if _cache_conn is None:
+        _cache_conn = open_cache()
+    return _cache_conn
+
+
+def _cache_get(key, conn=None):
+    with _cache_lock:
+        row = (conn or _get_cache()).execute("SELECT ts, json FROM responses WHERE key = ?", (key,)).fetchone()
+    if row and time.time() - row[0] < CACHE_TTL:
+        return json.loads(row[1])
+    return None
+
+
+def _cache_put(key, value, conn=None):
+    now = time.time()
+    with _cache_lock:
+        conn = conn or _get_cache()
+        # prune expired entries so the file doesn't grow with every new query
+        conn.execute("DELETE FROM responses WHERE ts < ?", (now - CACHE_TTL,))
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, ts, json) VALUES (?, ?, ?)",
+            (key, now, json.dumps(value)),
+        )
+        conn.commit()
+
 
 def prompt_for_api_key():
     key = input("Enter your SerpApi key (won't be saved): ").strip()
     return key or None
 
 
-def fetch_news(company, api_key, page=1, page_size=10):
+def fetch_news(company, api_key, page=1, page_size=10, use_cache=True, session=None, cache=None):
     """Fetch news search results from SerpApi (Google News via tbm=nws).
     Returns list of news result dicts (as returned under 'news_results').
+
+    Results are served from the local cache for CACHE_TTL seconds unless
+    `use_cache` is False. `session` (see new_session) and `cache` (see
+    open_cache) default to module-wide instances.
     """
+    key = _cache_key(company, page, page_size)
+    if use_cache:
+        try:
+            cached = _cache_get(key, cache)
+        except sqlite3.Error:
+            cached = None
+        if cached is not None:
+            return cached
     params = {
         "engine": "google",
         "q": company,
@@ -54,97 +157,225 @@ def fetch_news(company, api_key, page=1, page_size=10):
         "num": page_size,
         "start": (page - 1) * page_size,
     }
-    resp = requests.get(API_URL, params=params, timeout=15)
+    resp = (session or _get_session()).get(API_URL, params=params, timeout=15)
     resp.raise_for_status()
-    data = resp.json()
+    data = orjson.loads(resp.content) if orjson is not None else resp.json()
     # SerpApi returns 'news_results' for the news engine
-    return data.get("news_results", [])
+    results = data.get("news_results", [])
+    if use_cache:
+        try:
+            _cache_put(key, results, cache)
+        except sqlite3.Error:
+            # caching is best-effort
+            pass
+    return results
+
+
+_TRACKING_PARAMS = ("utm_", "gclid", "fbclid")
+
 
+def _canon(url):
+    """Canonicalize a URL for deduplication: drop the fragment and tracking
+    query parameters, lowercase the host and strip any trailing slash."""
+    u = urlsplit(url)
+    q = [(k, v) for k, v in parse_qsl(u.query, keep_blank_values=True) if not k.startswith(_TRACKING_PARAMS)]
+    return urlunsplit((u.scheme, u.netloc.lower(), u.path.rstrip("/"), urlencode(q), ""))
 
-def fetch_news_paginated(company, api_key, limit=10, page_size=20, max_pages=5, sleep_between=0.1, progress_callback=None):
+
+def _link_key(link):
+    """Compact 64-bit dedup key for a link. Keys are only compared within a
+    single fetch, so the per-process salt of hash() doesn't matter."""
+    try:
+        return hash(_canon(link))
+    except ValueError:
+        # malformed URL (e.g. a broken IPv6 host); compare it as-is
+        return hash(link)
+
+
+def fetch_news_paginated(company, api_key, limit=10, page_size=20, max_pages=5, sleep_between=0.1, progress_callback=None,
+                         session=None, cache=None, max_workers=6):
     """Fetch up to `limit` news articles by paging through SerpApi results.
 
-    - Deduplicates by link/url
-    - Stops early if SerpApi returns fewer than page_size results
+    - The pages `limit` needs are requested concurrently on a bounded thread
+      pool, but merged strictly in page order so the result doesn't depend
+      on timing
+    - Deduplicates by canonicalized link/url (see _canon)
+    - If duplicates leave fewer than `limit` articles, one spare page is
+      fetched afterwards (after sleeping `sleep_between` seconds)
+    - Stops at the first page that comes back short (no more results)
     - If `progress_callback` is provided, it will be called as
       progress_callback(page_number, total_results_collected)
+    - `session` and `cache` are passed through to fetch_news
     """
+    # resolve the session here so worker threads don't race to create it
+    session = session or _get_session()
     results = []
     seen_links = set()
-    page = 1
-    # adapt max_pages so we fetch enough when limit > page_size
-    max_pages = max_pages or (math.ceil(limit / page_size) + 2)
-    while len(results) < limit and page <= max_pages:
-        try:
-            batch = fetch_news(company, api_key, page=page, page_size=page_size)
-        except Exception:
-            break
-        if not batch:
-            # still call progress callback to indicate completion of this page
-            if progress_callback:
-                progress_callback(page, len(results))
-            break
+
+    def _merge(page, batch):
+        """Add a page's articles; return True when no more pages are needed."""
         for a in batch:
+            if len(results) >= limit:
+                break
             link = a.get("link") or a.get("url")
-            if link and link in seen_links:
-                continue
             if link:
-                seen_links.add(link)
+                key = _link_key(link)
+                if key in seen_links:
+                    continue
+                seen_links.add(key)
+            # fold the scoring text once, at ingestion
+            a["_text"] = _fold_text(a)
             results.append(a)
-            if len(results) >= limit:
-                break
         # report progress after processing each page
         if progress_callback:
             try:
                 progress_callback(page, len(results))
             except Exception:
                 pass
-        # If we got less than a full page, no more results likely
-        if len(batch) < page_size:
-            break
-        page += 1
+        # a short page is the last one; later pages would be empty
+        return len(results) >= limit or len(batch) < page_size
+
+    # never request more pages than limit needs, plus one spare for duplicates
+    needed_pages = math.ceil(limit / page_size)
+    max_pages = min(max_pages or needed_pages + 1, needed_pages + 1)
+    first_pages = min(needed_pages, max_pages)
+    done = False
+    next_page = 1
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, first_pages))) as pool:
+        futures = {
+            pool.submit(
+                fetch_news, company, api_key, page=page, page_size=page_size, session=session, cache=cache
+            ): page
+            for page in range(1, first_pages + 1)
+        }
+        completed = {}  # page -> batch, for pages not merged yet
+        for fut in as_completed(futures):
+            try:
+                completed[futures[fut]] = fut.result()
+            except Exception:
+                completed[futures[fut]] = []
+            # merge the unbroken run of finished pages starting at next_page
+            while not done and next_page in completed:
+                done = _merge(next_page, completed.pop(next_page))
+                next_page += 1
+            if done:
+                # drop pages that have not started yet
+                for pending in futures:
+                    pending.cancel()
+                break
+
+    # duplicates left us short of limit and results aren't exhausted
+    if not done and len(results) < limit and next_page <= max_pages:
         if sleep_between:
             time.sleep(sleep_between)
+        try:
+            batch = fetch_news(company, api_key, page=next_page, page_size=page_size, session=session, cache=cache)
+        except Exception:
+            batch = []
+        _merge(next_page, batch)
     return results
 
 
-def article_relevance_score(article, company):
+# Company-name tokens that say nothing about the company on their own, e.g.
+# 'the' in 'The New York Times Company'; they are not counted as partial matches.
+_NAME_STOPWORDS = frozenset({
+    "the", "and", "&", "of",
+    "inc", "inc.", "corp", "corp.", "corporation", "co", "co.", "company",
+    "ltd", "ltd.", "llc", "plc", "group", "holdings",
+})
+
+
+@functools.lru_cache(maxsize=32)
+def _build_term_counter(company):
+    """Return a function mapping case-folded text to the weighted frequency of
+    the company name (weight 1.0) and each of its tokens (weight 0.5), except
+    stopword tokens (see _NAME_STOPWORDS). Terms are weighted once per company
+    so each call is just a str.count per term.
+    """
+    name = company.casefold()
+    weights = {name: 1.0}
+    for t in name.split():
+        # a single-word name is always counted, even if it is a stopword
+        if t == name or t not in _NAME_STOPWORDS:
+            weights[t] = weights.get(t, 0.0) + 0.5
+    terms = list(weights.items())
+    return lambda text: sum(text.count(term) * weight for term, weight in terms)
+
+
+@functools.lru_cache(maxsize=4096)
+def _term_frequency(text, company):
+    """Weighted company-term frequency of `text`, memoized so articles seen
+    again (re-runs, overlapping pages) are not rescanned."""
+    return _build_term_counter(company)(text)
+
+
+def _parse_date(date_str):
+    """Parse an ISO-8601 date string, returning None if it isn't one."""
+    try:
+        return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+
+
+# Recency bonus is 2.0 for a brand-new article and halves every week.
+RECENCY_HALF_LIFE_HOURS = 7 * 24
+_DECAY_RATE = math.log(2) / RECENCY_HALF_LIFE_HOURS
+
+
+def _fold_text(article):
+    return f"{article.get('title','')} {article.get('snippet','')}".casefold()
+
+
+def _article_text(article):
+    """Case-folded title + snippet, precomputed by fetch_news_paginated."""
+    text = article.get("_text")
+    return text if text is not None else _fold_text(article)
+
+
+def _article_date(article):
+    return article.get("date") or article.get("published") or article.get("datetime")
+
+
+def _age_hours(date_str, now):
+    """Age in hours of an ISO-8601 `date_str` relative to `now`, or None."""
+    dt = _parse_date(date_str)
+    if dt is None:
+        return None
+    return (now - dtastimezone(dt)).total_seconds() / 3600
+
+
+def _recency_score(date_str, now):
+    """Recency bonus for an article date relative to `now` (newer = higher)."""
+    if not date_str:
+        return 0.0
+    # SerpApi 'date' values can be like '2 hours ago', '2025-12-23T10:34:00Z', etc.
+    # Try parsing ISO first
+    hours = _age_hours(date_str, now)
+    if hours is not None:
+        # future-dated articles (clock/timezone skew) count as brand new
+        return 2.0 * math.exp(-max(hours, 0.0) * _DECAY_RATE)
+    if "ago" in date_str:
+        # relative dates ('2 hours ago') are approximated as very recent
+        return 1.0
+    return 0.0
+
+
+def article_relevance_score(article, company, now=None):
     """Compute a simple relevance score for sorting:
     - frequency of company tokens in title + snippet (weighted)
     - recency bonus (newer = higher)
+
+    `now` is the reference time for recency; callers scoring a batch should
+    compute it once and pass it in.
     """
-    text = f"{article.get('title','')} {article.get('snippet','')}".lower()
-    name = company.lower()
-    # simple token match frequency
-    freq = text.count(name)
-    # word-level partial matches (split company into tokens)
-    for t in name.split():
-        freq += text.count(t) * 0.5
+    # full-name matches plus word-level partial matches
+    freq = _term_frequency(_article_text(article), company)
+    if not freq:
+        # off-topic article: no recency bonus, so skip date parsing
+        return 0.0
 
     # recency: use 'date' or 'published' if available
-    date_str = article.get("date") or article.get("published") or article.get("datetime")
-    recency_score = 0.0
-    if date_str:
-        try:
-            # SerpApi 'date' values can be like '2 hours ago', '2025-12-23T10:34:00Z', etc.
-            # Try parsing ISO first
-            dt = None
-            try:
-                dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-            except Exception:
-                # fallback: if it contains 'ago' or 'hour', approximate as very recent
-                if "ago" in date_str:
-                    recency_score = 1.0
-                else:
-                    # unknown format
-                    dt = None
-            if dt:
-                age_seconds = (datetime.now(timezone.utc) - dtastimezone(dt)).total_seconds()
-                # bucket recency: 48h or less gets bonus up to 2.0
-                hours = age_seconds / 3600
-                recency_score = max(0.0, (48 - min(hours, 48)) / 48 * 2.0)
-        except Exception:
-            recency_score = 0.0
+    recency_score = _recency_score(_article_date(article), now or datetime.now(timezone.utc))
 
     # combine scores
     score = freq * 10.0 + recency_score
@@ -158,39 +389,54 @@ def dtastimezone(dt):
     return dt.astimezone(timezone.utc)
 
 
-def rank_and_format(articles, company):
-    scored = []
-    for a in articles:
-        score = article_relevance_score(a, company)
-        scored.append((score, a))
-    scored.sort(key=lambda s: s[0], reverse=True)
-    return scored
+def rank_and_format(articles, company, limit=None):
+    """Return (score, article) pairs, best first. If `limit` is given only the
+    top `limit` pairs are selected and returned."""
+    now = datetime.now(timezone.utc)
+    scored = ((article_relevance_score(a, company, now=now), a) for a in articles)
+    if limit is not None:
+        # only the top `limit` pairs are ever held in memory
+        return heapq.nlargest(limit, scored, key=itemgetter(0))
+    return sorted(scored, key=itemgetter(0), reverse=True)
 
 
-def write_results(scored_articles, out_path="news.txt", limit=10):
-    lines = []
+def _emit(scored_articles, limit):
+    """Yield the lines of the news summary, each already newline-terminated."""
     now = datetime.now().isoformat()
-    lines.append(f"News summary generated: {now}\n")
+    yield f"News summary generated: {now}\n\n"
     if not scored_articles:
-        lines.append("No articles found.\n")
-    else:
-        for i, (score, art) in enumerate(scored_articles[:limit], 1):
-            title = art.get("title") or art.get("title_no_date") or "(No title)"
-            source = art.get("source") or art.get("provider") or "(Unknown source)"
-            date = art.get("date") or art.get("published") or "(Unknown date)"
-            link = art.get("link") or art.get("url") or "(No link)"
-            snippet = art.get("snippet") or art.get("snippet_highlighted") or ""
-            lines.append(f"{i}. {title}")
-            lines.append(f"   Source: {source}")
-            lines.append(f"   Date: {date}")
-            lines.append(f"   Link: {link}")
-            lines.append(f"   Snippet: {snippet}")
-            lines.append(f"   Relevance score: {score:.2f}\n")
-    with open(out_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
+        yield "No articles found.\n"
+        return
+    for i, (score, art) in enumerate(scored_articles[:limit], 1):
+        title = art.get("title") or art.get("title_no_date") or "(No title)"
+        source = art.get("source") or art.get("provider") or "(Unknown source)"
+        date = art.get("date") or art.get("published") or "(Unknown date)"
+        link = art.get("link") or art.get("url") or "(No link)"
+        snippet = art.get("snippet") or art.get("snippet_highlighted") or ""
+        if i > 1:
+            # blank line between entries
+            yield "\n"
+        yield f"{i}. {title}\n"
+        yield f"   Source: {source}\n"
+        yield f"   Date: {date}\n"
+        yield f"   Link: {link}\n"
+        yield f"   Snippet: {snippet}\n"
+        yield f"   Relevance score: {score:.2f}\n"
+
+
+def write_results(scored_articles, out_path="news.txt", limit=10):
+    with open(out_path, "w", encoding="utf-8", buffering=1 << 16) as f:
+        f.writelines(_emit(scored_articles, limit))
     print(f"Wrote top {min(limit, len(scored_articles))} results to {out_path}")
 
 
+def score_and_write(articles, company, out_path="news.txt", limit=10):
+    """Rank `articles` for `company` and write the top `limit` to `out_path`.
+    Scores are streamed into the top-K selection, so only `limit`
+    (score, article) pairs are held at once."""
+    write_results(rank_and_format(articles, company, limit=limit), out_path=out_path, limit=limit)
+
+
 def main():
     global SERPAPI_KEY
     # Support command-line mode for automation/tests: python news.py "Microsoft" 5
@@ -231,8 +477,7 @@ def main():
         print(f"Error fetching news: {e}")
         return
 
-    scored = rank_and_format(articles, company)
-    write_results(scored, out_path="news.txt", limit=limit)
+    score_and_write(articles, company, out_path="news.txt", limit=limit)
 
 
 if __name__ == "__main__":
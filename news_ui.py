@@ -1,9 +1,29 @@
-import os, sys, streamlit as st
+import io, os, sys, streamlit as st
 
-from news import fetch_news_paginated, rank_and_format
+from news import fetch_news_paginated, new_session, open_cache, rank_and_format
 
 SERPAPI_KEY = os.getenv("SERPAPI_KEY")
 
+
+@st.cache_resource
+def _get_session():
+    # one pooled HTTP session per Streamlit process, not per rerun
+    return new_session()
+
+
+@st.cache_resource
+def _get_cache():
+    # likewise for the SerpApi response cache connection
+    return open_cache()
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def _rank(articles, company, limit):
+    # Streamlit reruns the script on every interaction; reuse scores for
+    # identical result sets instead of rescoring them.
+    return rank_and_format(articles, company, limit=limit)
+
+
 st.title("Company News Search 🔍")
 company = st.text_input("Company name", value="Microsoft")
 limit = st.number_input("Number of articles", min_value=1, max_value=100, value=10)
@@ -33,21 +53,27 @@ if st.button("Search"):
                 page_size=min(50, max(10, limit)),
                 max_pages=6,
                 progress_callback=_progress_cb,
+                session=_get_session(),
+                cache=_get_cache(),
             )
             # finalize progress
             progress_bar.progress(100)
             status_text.text(f"Finished — fetched {len(articles)} articles")
 
-            scored = rank_and_format(articles, company)
+            scored = _rank(articles, company, limit)
             if not scored:
                 st.info("Empty Day — no articles found.")
             else:
                 if len(scored) < limit:
                     st.info(f"Showing {len(scored)} of requested {limit} articles (fewer results available).")
+                # build all results into one markdown document so they render
+                # in a single frame instead of several elements per article
+                md = io.StringIO()
                 for i, (score, art) in enumerate(scored[:limit], 1):
-                    st.subheader(f"{i}. {art.get('title','(no title)')}")
-                    st.write(f"**Source:** {art.get('source','?')} • **Date:** {art.get('date','?')}")
-                    st.write(art.get('snippet',''))
-                    st.markdown(f"[Read more]({art.get('link','')})")
-                    st.write(f"**Relevance:** {score:.2f}")
-                    st.write("---")
+                    md.write(f"### {i}. {art.get('title','(no title)')}\n")
+                    md.write(f"**Source:** {art.get('source','?')} • **Date:** {art.get('date','?')}\n\n")
+                    md.write(f"{art.get('snippet','')}\n\n")
+                    md.write(f"[Read more]({art.get('link','')})\n\n")
+                    md.write(f"**Relevance:** {score:.2f}\n\n")
+                    md.write("---\n")
+                st.markdown(md.getvalue())